@@ -1,15 +1,39 @@
-from flask import Flask, render_template, request, jsonify, session, Response
+from flask import Flask, render_template, request, jsonify, session, Response, stream_with_context
+from flask.json.provider import JSONProvider
+from flask.sessions import SecureCookieSessionInterface
 from flask_sqlalchemy import SQLAlchemy
+from flask_compress import Compress
+from sqlalchemy.engine import make_url
+from itsdangerous import URLSafeTimedSerializer
+from cachetools import TTLCache
+import msgspec
+import numpy as np
 import os
-import json
 import io
-import csv
+import gzip
 import logging
+import re
+import time
 from datetime import datetime, timedelta
 import uuid
+import threading
 import random
 from dotenv import load_dotenv
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # Numba is optional; kernels then run as plain NumPy/Python
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+try:
+    from compression import zstd  # Python 3.14+
+except ImportError:  # backports.zstd is installed with Flask-Compress
+    from backports import zstd
+
 # Load environment variables
 load_dotenv()
 
@@ -17,15 +41,114 @@ app = Flask(__name__)
 app.config['SECRET_KEY'] = os.environ.get('FLASK_SECRET_KEY', 'dev-secret-key-change-this')
 app.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get('DATABASE_URL', 'sqlite:///bloom.db')
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+# Connections are health-checked and recycled before server-side timeouts
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+    'pool_pre_ping': True,
+    'pool_recycle': 300
+}
+# Pooled connections so concurrent gevent requests never share one connection;
+# bursts overflow past pool_size. SQLite (e.g. the in-memory StaticPool) takes no sizing
+if make_url(app.config['SQLALCHEMY_DATABASE_URI']).get_backend_name() != 'sqlite':
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'].update(pool_size=10, max_overflow=20)
+
+# Compress JSON/CSV payloads on the wire; zstd when the client supports it
+app.config['COMPRESS_MIMETYPES'] = ['application/json', 'text/csv']
+app.config['COMPRESS_ALGORITHM'] = ['zstd', 'gzip']
+app.config['COMPRESS_MIN_SIZE'] = 512
 
 db = SQLAlchemy(app)
+Compress(app)
+
+@app.before_request
+def drop_refused_encodings():
+    """Strip q=0 entries from Accept-Encoding; Flask-Compress would still pick a refused encoding"""
+    header = request.environ.get('HTTP_ACCEPT_ENCODING')
+    if header and 'q=0' in header:
+        accepted = [(value, quality) for value, quality in request.accept_encodings if quality > 0]
+        request.environ['HTTP_ACCEPT_ENCODING'] = ', '.join(
+            value if quality == 1 else f'{value};q={quality}' for value, quality in accepted
+        )
+
+# msgspec encodes/decodes JSON in C; datetimes are serialized natively as ISO 8601
+json_encoder = msgspec.json.Encoder()
+json_decoder = msgspec.json.Decoder()
+
+class MsgspecJSONProvider(JSONProvider):
+    """Flask JSON provider backed by msgspec, used by jsonify and request.get_json"""
+
+    def dumps(self, obj, **kwargs):
+        return json_encoder.encode(obj).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return json_decoder.decode(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(json_encoder.encode(obj), mimetype='application/json')
+
+app.json = MsgspecJSONProvider(app)
+
+class MsgPackSessionSerializer:
+    """itsdangerous payload serializer that packs session data as MsgPack"""
+
+    def __init__(self):
+        self.encoder = msgspec.msgpack.Encoder()
+        self.decoder = msgspec.msgpack.Decoder()
+
+    def dumps(self, obj):
+        return self.encoder.encode(obj)
+
+    def loads(self, data):
+        return self.decoder.decode(data)
+
+class MsgPackSigningSerializer(URLSafeTimedSerializer):
+    """Signs binary payloads but returns the cookie value as text, as Werkzeug expects"""
+
+    def dumps(self, obj, salt=None):
+        return super().dumps(obj, salt).decode('ascii')
+
+class MsgPackSessionInterface(SecureCookieSessionInterface):
+    """Signed cookie sessions with compact MsgPack payloads instead of tagged JSON"""
+    # A distinct salt makes cookies in the old JSON format fail verification cleanly
+    salt = 'cookie-session-msgpack'
+    serializer = MsgPackSessionSerializer()
+
+    def get_signing_serializer(self, app):
+        if not app.secret_key:
+            return None
+        signer_kwargs = {
+            'key_derivation': self.key_derivation,
+            'digest_method': self.digest_method
+        }
+        return MsgPackSigningSerializer(
+            app.secret_key, salt=self.salt, serializer=self.serializer, signer_kwargs=signer_kwargs
+        )
+
+app.session_interface = MsgPackSessionInterface()
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+if not NUMBA_AVAILABLE:
+    logger.warning("numba not installed; trend and streak kernels run as plain Python")
+
 # ==================== MODELS ====================
 
+class MsgPackType(db.TypeDecorator):
+    """Stores Python lists/dicts as MsgPack-encoded binary"""
+    impl = db.LargeBinary
+    cache_ok = True
+
+    _encoder = msgspec.msgpack.Encoder()
+    _decoder = msgspec.msgpack.Decoder()
+
+    def process_bind_param(self, value, dialect):
+        return self._encoder.encode(value) if value is not None else None
+
+    def process_result_value(self, value, dialect):
+        return self._decoder.decode(value) if value is not None else None
+
 class User(db.Model):
     __tablename__ = 'users'
 
@@ -37,7 +160,8 @@ class User(db.Model):
     last_active = db.Column(db.DateTime, default=datetime.utcnow)
 
     # Relationships
-    responses = db.relationship('DailyResponse', backref='user', lazy=True, cascade='all, delete-orphan')
+    # lazy='raise' turns accidental N+1 loads into errors; use selectinload(User.responses) when needed
+    responses = db.relationship('DailyResponse', back_populates='user', lazy='raise', cascade='all, delete-orphan')
 
     def __repr__(self):
         return f'<User {self.id[:8]}... {self.department}>'
@@ -47,60 +171,80 @@ class User(db.Model):
             'id': self.id,
             'department': self.department,
             'role_level': self.role_level,
-            'created_at': self.created_at.isoformat(),
+            'created_at': self.created_at,
             'days_active': (datetime.utcnow() - self.created_at).days
         }
 
 class DailyResponse(db.Model):
     """Daily questionnaire responses with AI analysis"""
     __tablename__ = 'daily_responses'
+    __table_args__ = (
+        # Matches the per-user, newest-first streak/trend and dashboard queries
+        db.Index('ix_dr_user_created', 'user_id', db.text('created_at DESC')),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
-    user_id = db.Column(db.String(36), db.ForeignKey('users.id'), nullable=False, index=True)
+    user_id = db.Column(db.String(36), db.ForeignKey('users.id'), nullable=False)
 
     # Raw questionnaire data
-    questions = db.Column(db.Text, nullable=False)  # JSON string of questions asked
-    responses = db.Column(db.Text, nullable=False)  # JSON string of user responses
+    questions = db.Column(MsgPackType, nullable=False)  # List of questions asked
+    responses = db.Column(MsgPackType, nullable=False)  # List of user responses
 
     # AI analysis results
     burnout_score = db.Column(db.Float, nullable=True, index=True)
-    ai_analysis = db.Column(db.Text, nullable=True)  # JSON string of full AI analysis
-    concerns = db.Column(db.Text, nullable=True)  # JSON array of identified concerns
-    recommendations = db.Column(db.Text, nullable=True)  # JSON array of recommendations
+    ai_analysis = db.Column(MsgPackType, nullable=True)  # Full AI analysis dict
+    concerns = db.Column(MsgPackType, nullable=True)  # List of identified concerns
+    recommendations = db.Column(MsgPackType, nullable=True)  # List of recommendations
     urgency_level = db.Column(db.String(20), nullable=True, index=True)  # low, medium, high
+    summary = db.Column(db.String(500), nullable=True)  # Copy of ai_analysis['summary'] for exports
 
     # Metadata
     response_time_seconds = db.Column(db.Integer, nullable=True)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    # Relationships
+    user = db.relationship('User', back_populates='responses')
 
     def __repr__(self):
         return f'<Response {self.id} - Score: {self.burnout_score}>'
 
     def get_responses_dict(self):
-        """Parse responses JSON safely"""
-        try:
-            return json.loads(self.responses) if self.responses else {}
-        except json.JSONDecodeError:
-            return {}
+        """Return responses, or an empty dict when missing"""
+        return self.responses or {}
 
     def get_analysis_dict(self):
-        """Parse AI analysis JSON safely"""
-        try:
-            return json.loads(self.ai_analysis) if self.ai_analysis else {}
-        except json.JSONDecodeError:
-            return {}
+        """Return AI analysis, or an empty dict when missing"""
+        return self.ai_analysis or {}
 
     def to_dict(self):
         return {
             'id': self.id,
             'burnout_score': self.burnout_score,
             'urgency_level': self.urgency_level,
-            'concerns': json.loads(self.concerns) if self.concerns else [],
-            'recommendations': json.loads(self.recommendations) if self.recommendations else [],
-            'created_at': self.created_at.isoformat(),
+            'concerns': self.concerns or [],
+            'recommendations': self.recommendations or [],
+            'created_at': self.created_at,
             'responses': self.get_responses_dict()
         }
 
+# ==================== REQUEST SCHEMAS ====================
+
+class RegisterRequest(msgspec.Struct):
+    """Body of POST /register"""
+    company_id: str = ''
+    department: str | None = None
+    role_level: str | None = None
+
+class SubmitRequest(msgspec.Struct):
+    """Body of POST /api/submit"""
+    questions: list[dict] = []
+    responses: list = []
+    response_time_seconds: int | float | None = 0
+
+# Typed decoders validate and deserialize request bodies in a single pass
+register_decoder = msgspec.json.Decoder(RegisterRequest)
+submit_decoder = msgspec.json.Decoder(SubmitRequest)
+
 # ==================== BASIC ROUTES ====================
 
 @app.route('/')
@@ -119,23 +263,34 @@ def dashboard():
 def company_dashboard():
     return render_template('company_dashboard.html')
 
+# Health checks are polled by load balancers; serve counts from memory for a few seconds
+HEALTH_CACHE_SECONDS = 5
+_health_counts = {'value': None, 'expires': 0.0}
+
+def get_health_counts():
+    """Get (user_count, response_count) in one round-trip, cached briefly"""
+    now = time.monotonic()
+    if _health_counts['value'] is None or now >= _health_counts['expires']:
+        # Doubles as the database connectivity check
+        row = db.session.execute(db.text(
+            'SELECT (SELECT COUNT(*) FROM users) AS users, '
+            '(SELECT COUNT(*) FROM daily_responses) AS responses'
+        )).one()
+        _health_counts['value'] = (row.users, row.responses)
+        _health_counts['expires'] = now + HEALTH_CACHE_SECONDS
+    return _health_counts['value']
+
 @app.route('/health')
 def health():
     """Health check endpoint with system statistics"""
     try:
-        # Test database connection
-        with app.app_context():
-            result = db.session.execute(db.text('SELECT 1')).scalar()
-            db_status = 'connected' if result == 1 else 'error'
-
-        user_count = User.query.count()
-        response_count = DailyResponse.query.count()
+        user_count, response_count = get_health_counts()
 
         return jsonify({
             'status': 'healthy',
             'message': 'Bloom is running! 🌸',
-            'timestamp': datetime.now().isoformat(),
-            'database': db_status,
+            'timestamp': datetime.now(),
+            'database': 'connected',
             'statistics': {
                 'total_users': user_count,
                 'total_responses': response_count,
@@ -153,7 +308,7 @@ def health():
         return jsonify({
             'status': 'unhealthy',
             'message': f'Health check failed: {str(e)}',
-            'timestamp': datetime.now().isoformat()
+            'timestamp': datetime.now()
         }), 500
 
 @app.route('/register', methods=['GET', 'POST'])
@@ -162,17 +317,20 @@ def register():
         return render_template('index.html')
 
     try:
-        data = request.get_json()
+        try:
+            data = register_decoder.decode(request.get_data())
+        except msgspec.DecodeError as e:
+            return jsonify({'success': False, 'error': f'Invalid registration data: {e}'}), 400
 
         # Validate required fields
-        if not data.get('company_id'):
+        if not data.company_id:
             return jsonify({'success': False, 'error': 'Company ID is required'}), 400
 
         # Create new user
         user = User(
-            company_id=data['company_id'].lower().strip(),
-            department=data.get('department', '').lower().strip() if data.get('department') else None,
-            role_level=data.get('role_level', '').lower().strip() if data.get('role_level') else None
+            company_id=data.company_id.lower().strip(),
+            department=data.department.lower().strip() if data.department else None,
+            role_level=data.role_level.lower().strip() if data.role_level else None
         )
 
         db.session.add(user)
@@ -240,6 +398,32 @@ def get_fallback_questions():
         }
     ]
 
+# Dedicated generator, so seeding elsewhere never affects question order
+question_rng = random.Random()
+
+# Minimum age of users.last_active before a questionnaire load rewrites it
+LAST_ACTIVE_WRITE_INTERVAL = timedelta(minutes=5)
+
+# Built once at import; the question dicts are shared read-only between requests
+FALLBACK_QUESTIONS = tuple(get_fallback_questions())
+
+DEPARTMENT_QUESTIONS = {
+    'engineering': {
+        'id': 6,
+        'question': 'How manageable is your current coding workload?',
+        'type': 'scale',
+        'scale_label': '1 = Overwhelming,10 = Very Manageable',
+        'category': 'workload'
+    },
+    'sales': {
+        'id': 6,
+        'question': 'How confident do you feel about meeting your targets?',
+        'type': 'scale',
+        'scale_label': '1 = Not Confident,10 = Very Confident',
+        'category': 'confidence'
+    }
+}
+
 @app.route('/api/questions')
 def get_questions():
     """Generate personalized questions for user"""
@@ -253,36 +437,23 @@ def get_questions():
         if not user:
             return jsonify({'error': 'User not found'}), 404
 
-        # Update last active
-        user.last_active = datetime.utcnow()
-        db.session.commit()
+        # Update last active, but only write when the stored value is stale
+        now = datetime.utcnow()
+        if user.last_active is None or now - user.last_active >= LAST_ACTIVE_WRITE_INTERVAL:
+            user.last_active = now
+            db.session.commit()
 
         # For now, use fallback questions
         # In production, this would call AI service to generate personalized questions
-        questions = get_fallback_questions()
+        pool = FALLBACK_QUESTIONS
 
         # Could personalize based on user's previous responses, department, etc.
         # For example, add department-specific questions
-        if user.department == 'engineering':
-            questions.append({
-                'id': 6,
-                'question': 'How manageable is your current coding workload?',
-                'type': 'scale',
-                'scale_label': '1 = Overwhelming,10 = Very Manageable',
-                'category': 'workload'
-            })
-        elif user.department == 'sales':
-            questions.append({
-                'id': 6,
-                'question': 'How confident do you feel about meeting your targets?',
-                'type': 'scale',
-                'scale_label': '1 = Not Confident,10 = Very Confident',
-                'category': 'confidence'
-            })
+        if user.department in DEPARTMENT_QUESTIONS:
+            pool += (DEPARTMENT_QUESTIONS[user.department],)
 
-        # Randomize question order for variety
-        random.shuffle(questions)
-        questions = questions[:5]  # Limit to 5 questions
+        # Randomize question order for variety, limited to 5 questions
+        questions = question_rng.sample(pool, min(5, len(pool)))
 
         return jsonify({
             'questions': questions,
@@ -298,43 +469,45 @@ def get_questions():
 
 # ==================== RESPONSE SUBMISSION ====================
 
+STRESS_KEYWORDS = ('overwhelmed', 'stressed', 'tired', 'burned', 'exhausted',
+                   'pressure', 'deadline', 'too much', 'can\'t cope')
+
+# Single alternation scans a response once instead of once per keyword
+STRESS_PATTERN = re.compile('|'.join(map(re.escape, STRESS_KEYWORDS)))
+
 def analyze_responses(questions, responses):
     """Analyze user responses and generate insights"""
     try:
         # Calculate burnout score based on responses
         total_score = 0
-        scale_count = 0
+        scale_values = []
+        is_stress = []
         stress_factors = []
 
         for i, question in enumerate(questions):
             response = responses[i] if i < len(responses) else None
 
             if question['type'] == 'scale' and response is not None:
-                scale_value = float(response)
-                scale_count += 1
-
-                # Convert scale responses to burnout indicators
-                if question['category'] in ['stress']:
-                    # Higher stress = higher burnout score
-                    total_score += scale_value * 10
-                elif question['category'] in ['energy', 'satisfaction', 'balance']:
-                    # Lower energy/satisfaction/balance = higher burnout score
-                    total_score += (11 - scale_value) * 10
-                else:
-                    # General case - lower rating = higher burnout
-                    total_score += (11 - scale_value) * 10
+                scale_values.append(response)
+                is_stress.append(question['category'] == 'stress')
 
             elif question['type'] == 'text' and response:
                 # Analyze text for stress indicators
-                stress_keywords = ['overwhelmed', 'stressed', 'tired', 'burned', 'exhausted',
-                                   'pressure', 'deadline', 'too much', 'can\'t cope']
-                response_lower = response.lower()
+                found = set(STRESS_PATTERN.findall(response.lower()))
 
-                for keyword in stress_keywords:
-                    if keyword in response_lower:
+                for keyword in STRESS_KEYWORDS:
+                    if keyword in found:
                         stress_factors.append(f"Mentioned feeling {keyword}")
                         total_score += 15  # Add to burnout score
 
+        # Convert scale responses to burnout indicators in one vectorized pass:
+        # higher stress = higher burnout score, while lower energy/satisfaction/
+        # balance (and any other rating) = higher burnout score
+        scale_count = len(scale_values)
+        if scale_count > 0:
+            values = np.asarray(scale_values, dtype=np.float64)
+            total_score += float(np.where(is_stress, values * 10, (11 - values) * 10).sum())
+
         # Calculate final score (0-100, where higher = more burnout risk)
         if scale_count > 0:
             burnout_score = min(100, total_score / scale_count)
@@ -418,10 +591,17 @@ def submit_responses():
         if not user_id:
             return jsonify({'error': 'Authentication required'}), 401
 
-        data = request.get_json()
-        questions = data.get('questions', [])
-        responses = data.get('responses', [])
-        response_time = data.get('response_time_seconds', 0)
+        try:
+            data = submit_decoder.decode(request.get_data())
+        except msgspec.DecodeError as e:
+            return jsonify({'error': f'Invalid submission: {e}'}), 400
+
+        questions = data.questions
+        responses = data.responses
+        # Clients may report fractional seconds; the column stores whole seconds
+        response_time = data.response_time_seconds
+        if response_time is not None:
+            response_time = int(response_time)
 
         if not questions or not responses:
             return jsonify({'error': 'Questions and responses are required'}), 400
@@ -429,20 +609,20 @@ def submit_responses():
         # Analyze responses
         analysis = analyze_responses(questions, responses)
 
-        # Save to database
-        daily_response = DailyResponse(
-            user_id=user_id,
-            questions=json.dumps(questions),
-            responses=json.dumps(responses),
-            burnout_score=analysis['score'],
-            ai_analysis=json.dumps(analysis),
-            concerns=json.dumps(analysis['concerns']),
-            recommendations=json.dumps(analysis['recommendations']),
-            urgency_level=analysis['urgency'],
-            response_time_seconds=response_time
-        )
-
-        db.session.add(daily_response)
+        # Save to database with a Core INSERT; nothing reads the row back, so the
+        # ORM unit-of-work and identity map would be pure overhead here
+        db.session.execute(db.insert(DailyResponse), {
+            'user_id': user_id,
+            'questions': questions,
+            'responses': responses,
+            'burnout_score': analysis['score'],
+            'ai_analysis': analysis,
+            'concerns': analysis['concerns'],
+            'recommendations': analysis['recommendations'],
+            'urgency_level': analysis['urgency'],
+            'summary': analysis.get('summary'),
+            'response_time_seconds': response_time
+        })
         db.session.commit()
 
         logger.info(f"Response submitted for user {user_id[:8]}... Score: {analysis['score']}")
@@ -460,6 +640,9 @@ def submit_responses():
 
 # ==================== API ROUTES ====================
 
+# Generator for demo dashboard data
+demo_rng = np.random.default_rng()
+
 @app.route('/api/user-data')
 def get_user_data():
     """Get user's historical data for dashboard (with demo data)"""
@@ -468,27 +651,20 @@ def get_user_data():
 
         # For testing without a real user session, return demo data
         if not user_id:
-            # Generate demo chart data for last 30 days
-            chart_data = []
-            for i in range(30, 0, -1):
-                date = datetime.utcnow() - timedelta(days=i)
-                base_score = 70
-                daily_variation = random.uniform(-8, 8)
-                weekly_trend = -2 if i > 20 else 1  # Improvement trend
-                score = base_score + daily_variation + weekly_trend
-                score = max(30, min(95, score))  # Keep in reasonable range
-
-                urgency = 'low'
-                if score < 50:
-                    urgency = 'high'
-                elif score < 65:
-                    urgency = 'medium'
-
-                chart_data.append({
-                    'date': date.strftime('%Y-%m-%d'),
-                    'score': round(score, 1),
-                    'urgency': urgency
-                })
+            # Generate demo chart data for last 30 days in one vectorized pass
+            days_ago = np.arange(30, 0, -1)
+            base_score = 70
+            daily_variation = demo_rng.uniform(-8, 8, days_ago.size)
+            weekly_trend = np.where(days_ago > 20, -2, 1)  # Improvement trend
+            scores = np.clip(base_score + daily_variation + weekly_trend, 30, 95)  # Keep in reasonable range
+            urgencies = np.where(scores < 50, 'high', np.where(scores < 65, 'medium', 'low'))
+
+            now = datetime.utcnow()
+            chart_data = [{
+                'date': (now - timedelta(days=days)).date(),
+                'score': score,
+                'urgency': urgency
+            } for days, score, urgency in zip(days_ago.tolist(), scores.round(1).tolist(), urgencies.tolist())]
 
             demo_analysis = {
                 'score': 73,
@@ -516,34 +692,49 @@ def get_user_data():
                 }
             })
 
-        # Get last 30 days of responses for real user
+        # Get last 30 days of responses for real user, fetching only the chart columns
         thirty_days_ago = datetime.utcnow() - timedelta(days=30)
-        responses = DailyResponse.query.filter_by(user_id=user_id) \
-            .filter(DailyResponse.created_at >= thirty_days_ago) \
-            .order_by(DailyResponse.created_at.asc()).all()
+        in_window = (DailyResponse.user_id == user_id, DailyResponse.created_at >= thirty_days_ago)
+
+        # Read-only path: skip the pre-query flush of the session
+        with db.session.no_autoflush:
+            rows = db.session.execute(
+                db.select(DailyResponse.created_at, DailyResponse.burnout_score, DailyResponse.urgency_level)
+                .where(*in_window)
+                .order_by(DailyResponse.created_at.asc())
+            ).all()
 
-        # Prepare chart data
+        # Prepare chart data, accumulating the score total in the same pass
         chart_data = []
-        latest_analysis = None
+        total_score = 0
 
-        for response in responses:
+        for row in rows:
+            score = row.burnout_score or 0
+            total_score += score
             chart_data.append({
-                'date': response.created_at.strftime('%Y-%m-%d'),
-                'score': response.burnout_score or 0,
-                'urgency': response.urgency_level or 'low'
+                'date': row.created_at.date(),
+                'score': score,
+                'urgency': row.urgency_level or 'low'
             })
 
-            if response == responses[-1]:  # Latest response
-                try:
-                    latest_analysis = json.loads(response.ai_analysis) if response.ai_analysis else {}
-                except:
-                    latest_analysis = {}
+        avg_score = total_score / len(rows) if rows else 0
+        latest_analysis = None
+
+        if rows:
+            # Only the latest response needs its full analysis blob
+            with db.session.no_autoflush:
+                latest_analysis = db.session.execute(
+                    db.select(DailyResponse.ai_analysis)
+                    .where(*in_window)
+                    .order_by(DailyResponse.created_at.desc())
+                    .limit(1)
+                ).scalar() or {}
 
         return jsonify({
             'chart_data': chart_data,
             'latest_analysis': latest_analysis,
-            'total_responses': len(responses),
-            'avg_score': sum(r.burnout_score or 0 for r in responses) / len(responses) if responses else 0,
+            'total_responses': len(rows),
+            'avg_score': avg_score,
             'streak': calculate_check_in_streak(user_id)
         })
 
@@ -551,6 +742,35 @@ def get_user_data():
         logger.error(f"User data retrieval error: {str(e)}")
         return jsonify({'error': 'Failed to retrieve user data'}), 500
 
+# Short-lived per-user memo of /api/user-progress results, shared by the worker's greenlets
+progress_cache = TTLCache(maxsize=10_000, ttl=60)
+progress_cache_lock = threading.RLock()
+
+def build_user_progress(user_id):
+    """Compute progress metrics, streak and trend for a user"""
+    # Same exact 30-day cutoff as /api/user-data
+    thirty_days_ago = datetime.utcnow() - timedelta(days=30)
+
+    # One per-day aggregate query feeds the streak and the response count
+    daily_stats = get_user_dashboard_stats(user_id, thirty_days_ago)
+    response_count = sum(row.responses for row in daily_stats)
+
+    if not response_count:
+        return {
+            'progress_data': {},
+            'trend_analysis': 'No data available yet',
+            'streak': 0
+        }
+
+    # The trend splits individual responses into halves, so it needs per-response scores
+    scores = get_recent_scores(user_id, thirty_days_ago)
+
+    return {
+        'progress_data': calculate_progress_metrics(response_count),
+        'streak': count_check_in_streak(row.day for row in daily_stats),
+        'trend_analysis': analyze_wellness_trend(scores)
+    }
+
 @app.route('/api/user-progress')
 def get_user_progress():
     """Get detailed user progress analytics"""
@@ -560,88 +780,117 @@ def get_user_progress():
             # Return demo progress data
             return jsonify({
                 'progress_data': {
-                    'energy': random.uniform(6.5, 8.0),
-                    'satisfaction': random.uniform(6.0, 7.5),
-                    'balance': random.uniform(5.5, 7.0),
-                    'stress': random.uniform(6.0, 7.5)
+                    'energy': float(demo_rng.uniform(6.5, 8.0)),
+                    'satisfaction': float(demo_rng.uniform(6.0, 7.5)),
+                    'balance': float(demo_rng.uniform(5.5, 7.0)),
+                    'stress': float(demo_rng.uniform(6.0, 7.5))
                 },
                 'trend_analysis': 'Gradual improvement over the past weeks',
-                'streak': random.randint(3, 14)
-            })
-
-        # Get responses from last 30 days
-        thirty_days_ago = datetime.utcnow() - timedelta(days=30)
-        responses = DailyResponse.query.filter_by(user_id=user_id) \
-            .filter(DailyResponse.created_at >= thirty_days_ago) \
-            .order_by(DailyResponse.created_at.asc()).all()
-
-        if not responses:
-            return jsonify({
-                'progress_data': {},
-                'trend_analysis': 'No data available yet',
-                'streak': 0
+                'streak': int(demo_rng.integers(3, 14, endpoint=True))
             })
 
-        # Calculate progress metrics
-        progress_data = calculate_progress_metrics(responses)
+        # Read-only path: skip the pre-query flush of the session
+        with db.session.no_autoflush:
+            # Results only change when the user submits (new max id) or the day rolls over
+            last_response_id = db.session.execute(
+                db.select(db.func.max(DailyResponse.id)).where(DailyResponse.user_id == user_id)
+            ).scalar()
+            cache_key = (user_id, last_response_id, datetime.utcnow().date())
 
-        # Calculate streak
-        streak = calculate_check_in_streak(user_id)
+            with progress_cache_lock:
+                progress = progress_cache.get(cache_key)
 
-        # Trend analysis
-        trend_analysis = analyze_wellness_trend(responses)
+            if progress is None:
+                progress = build_user_progress(user_id)
+                with progress_cache_lock:
+                    progress_cache[cache_key] = progress
 
-        return jsonify({
-            'progress_data': progress_data,
-            'trend_analysis': trend_analysis,
-            'streak': streak
-        })
+        return jsonify(progress)
 
     except Exception as e:
         logger.error(f"User progress error: {str(e)}")
         return jsonify({'error': 'Failed to load progress data'}), 500
 
+def build_demo_company_analytics(period):
+    """Build demo company analytics for a reporting period"""
+    # Generate realistic demo data
+    return {
+        'total_users': 147,
+        'avg_wellness_score': 68.7,
+        'high_risk_count': 12,
+        'medium_risk_count': 28,
+        'low_risk_count': 107,
+        'participation_rate': 0.84,
+        'department_breakdown': [
+            {'department': 'Engineering', 'avg_score': 65.2, 'total': 45, 'high_risk': 8, 'medium_risk': 15},
+            {'department': 'Sales', 'avg_score': 58.1, 'total': 35, 'high_risk': 12, 'medium_risk': 18},
+            {'department': 'Marketing', 'avg_score': 72.3, 'total': 28, 'high_risk': 3, 'medium_risk': 8},
+            {'department': 'HR', 'avg_score': 78.9, 'total': 15, 'high_risk': 1, 'medium_risk': 4},
+            {'department': 'Finance', 'avg_score': 69.4, 'total': 24, 'high_risk': 2, 'medium_risk': 6}
+        ],
+        'trend_data': [
+            {'date': '2025-07-20', 'avg_score': 67.2},
+            {'date': '2025-07-21', 'avg_score': 68.1},
+            {'date': '2025-07-22', 'avg_score': 69.3},
+            {'date': '2025-07-23', 'avg_score': 68.7},
+            {'date': '2025-07-24', 'avg_score': 70.1},
+            {'date': '2025-07-25', 'avg_score': 69.8},
+            {'date': '2025-07-26', 'avg_score': 68.9},
+            {'date': '2025-07-27', 'avg_score': 68.7}
+        ],
+        'top_concerns': [
+            {'name': 'Heavy Workload', 'count': 89, 'percentage': 60.5},
+            {'name': 'Work-Life Balance', 'count': 67, 'percentage': 45.6},
+            {'name': 'Lack of Recognition', 'count': 45, 'percentage': 30.6},
+            {'name': 'Communication Issues', 'count': 38, 'percentage': 25.9},
+            {'name': 'Limited Growth Opportunities', 'count': 29, 'percentage': 19.7}
+        ]
+    }
+
+# Demo payloads are static, so serialize them once per period at import time.
+# Real analytics should refresh these on a TTL rather than rebuild per request.
+COMPANY_ANALYTICS_PERIODS = ('7d', '30d', '90d')
+COMPANY_ANALYTICS_CACHE = {
+    period: json_encoder.encode(build_demo_company_analytics(period))
+    for period in COMPANY_ANALYTICS_PERIODS
+}
+# Pre-compressed once too, in both encodings Flask-Compress offers, so it never
+# recompresses them per request
+COMPANY_ANALYTICS_ZSTD_CACHE = {
+    period: zstd.compress(payload, app.config['COMPRESS_ZSTD_LEVEL'])
+    for period, payload in COMPANY_ANALYTICS_CACHE.items()
+}
+COMPANY_ANALYTICS_GZIP_CACHE = {
+    period: gzip.compress(payload, mtime=0)
+    for period, payload in COMPANY_ANALYTICS_CACHE.items()
+}
+# Same preference order as COMPRESS_ALGORITHM
+COMPANY_ANALYTICS_ENCODED_CACHES = (
+    ('zstd', COMPANY_ANALYTICS_ZSTD_CACHE),
+    ('gzip', COMPANY_ANALYTICS_GZIP_CACHE)
+)
+
 @app.route('/api/company-analytics')
 def get_company_analytics():
     """Get company-wide analytics (demo data for now)"""
     try:
         period = request.args.get('period', '7d')
+        if period not in COMPANY_ANALYTICS_CACHE:
+            period = '7d'
 
-        # Generate realistic demo data
-        demo_data = {
-            'total_users': 147,
-            'avg_wellness_score': 68.7,
-            'high_risk_count': 12,
-            'medium_risk_count': 28,
-            'low_risk_count': 107,
-            'participation_rate': 0.84,
-            'department_breakdown': [
-                {'department': 'Engineering', 'avg_score': 65.2, 'total': 45, 'high_risk': 8, 'medium_risk': 15},
-                {'department': 'Sales', 'avg_score': 58.1, 'total': 35, 'high_risk': 12, 'medium_risk': 18},
-                {'department': 'Marketing', 'avg_score': 72.3, 'total': 28, 'high_risk': 3, 'medium_risk': 8},
-                {'department': 'HR', 'avg_score': 78.9, 'total': 15, 'high_risk': 1, 'medium_risk': 4},
-                {'department': 'Finance', 'avg_score': 69.4, 'total': 24, 'high_risk': 2, 'medium_risk': 6}
-            ],
-            'trend_data': [
-                {'date': '2025-07-20', 'avg_score': 67.2},
-                {'date': '2025-07-21', 'avg_score': 68.1},
-                {'date': '2025-07-22', 'avg_score': 69.3},
-                {'date': '2025-07-23', 'avg_score': 68.7},
-                {'date': '2025-07-24', 'avg_score': 70.1},
-                {'date': '2025-07-25', 'avg_score': 69.8},
-                {'date': '2025-07-26', 'avg_score': 68.9},
-                {'date': '2025-07-27', 'avg_score': 68.7}
-            ],
-            'top_concerns': [
-                {'name': 'Heavy Workload', 'count': 89, 'percentage': 60.5},
-                {'name': 'Work-Life Balance', 'count': 67, 'percentage': 45.6},
-                {'name': 'Lack of Recognition', 'count': 45, 'percentage': 30.6},
-                {'name': 'Communication Issues', 'count': 38, 'percentage': 25.9},
-                {'name': 'Limited Growth Opportunities', 'count': 29, 'percentage': 19.7}
-            ]
-        }
+        # Pick the encoding with the highest q-value (ties keep our preference order);
+        # q=0 means the client refuses it
+        accept = request.accept_encodings
+        encoding, encoded_cache = max(COMPANY_ANALYTICS_ENCODED_CACHES, key=lambda item: accept[item[0]])
+
+        if accept[encoding] > 0:
+            response = Response(encoded_cache[period], mimetype='application/json')
+            response.headers['Content-Encoding'] = encoding
+        else:
+            response = Response(COMPANY_ANALYTICS_CACHE[period], mimetype='application/json')
 
-        return jsonify(demo_data)
+        response.vary.add('Accept-Encoding')
+        return response
 
     except Exception as e:
         logger.error(f"Company analytics error: {str(e)}")
@@ -681,13 +930,24 @@ def export_user_data():
         if not user:
             return jsonify({'error': 'User not found'}), 404
 
-        # Get all responses
-        responses = DailyResponse.query.filter_by(user_id=user_id) \
-            .order_by(DailyResponse.created_at.desc()).all()
-
+        # CSV is streamed straight from the database
         if format_type == 'csv':
-            return export_csv(responses)
-        elif format_type == 'pdf':
+            return export_csv(user_id)
+
+        # Get all responses as lightweight rows with only the columns the exports read
+        responses = db.session.execute(
+            db.select(
+                DailyResponse.created_at,
+                DailyResponse.burnout_score,
+                DailyResponse.urgency_level,
+                DailyResponse.concerns,
+                DailyResponse.recommendations,
+                DailyResponse.summary
+            ).where(DailyResponse.user_id == user_id)
+            .order_by(DailyResponse.created_at.desc())
+        ).all()
+
+        if format_type == 'pdf':
             return export_pdf(responses, user)
         else:  # json
             return export_json(responses, user)
@@ -698,37 +958,57 @@ def export_user_data():
 
 # ==================== HELPER FUNCTIONS ====================
 
-def export_csv(responses):
-    """Export data as CSV"""
-    output = io.StringIO()
-    writer = csv.writer(output)
-
-    # Headers
-    writer.writerow([
-        'Date', 'Wellness Score', 'Urgency Level', 'Concerns', 'Recommendations'
-    ])
-
-    # Data rows
-    for response in responses:
-        try:
-            concerns = json.loads(response.concerns) if response.concerns else []
-            recommendations = json.loads(response.recommendations) if response.recommendations else []
-
-            writer.writerow([
-                response.created_at.strftime('%Y-%m-%d %H:%M'),
-                response.burnout_score or 0,
-                response.urgency_level or 'low',
-                '; '.join(concerns),
-                '; '.join([r.get('action', str(r)) for r in recommendations if isinstance(r, dict)])
-            ])
-        except Exception as e:
-            logger.warning(f"CSV export row error: {e}")
-            continue
-
-    output.seek(0)
+def export_csv(user_id):
+    """Export data as CSV, streamed one row at a time"""
+    import csv
+
+    query = db.select(
+        DailyResponse.created_at,
+        DailyResponse.burnout_score,
+        DailyResponse.urgency_level,
+        DailyResponse.concerns,
+        DailyResponse.recommendations
+    ).where(DailyResponse.user_id == user_id) \
+        .order_by(DailyResponse.created_at.desc()) \
+        .execution_options(yield_per=200)
+
+    def generate():
+        output = io.StringIO()
+        writer = csv.writer(output)
+
+        def flush():
+            chunk = output.getvalue()
+            output.seek(0)
+            output.truncate()
+            return chunk
+
+        # Headers
+        writer.writerow([
+            'Date', 'Wellness Score', 'Urgency Level', 'Concerns', 'Recommendations'
+        ])
+        yield flush()
+
+        # Data rows
+        for row in db.session.execute(query):
+            try:
+                concerns = row.concerns or []
+                recommendations = row.recommendations or []
+
+                writer.writerow([
+                    row.created_at.strftime('%Y-%m-%d %H:%M'),
+                    row.burnout_score or 0,
+                    row.urgency_level or 'low',
+                    '; '.join(concerns),
+                    '; '.join([r.get('action', str(r)) for r in recommendations if isinstance(r, dict)])
+                ])
+            except Exception as e:
+                logger.warning(f"CSV export row error: {e}")
+                continue
+
+            yield flush()
 
     return Response(
-        output.getvalue(),
+        stream_with_context(generate()),
         mimetype='text/csv',
         headers={'Content-Disposition': 'attachment; filename=bloom-wellness-data.csv'}
     )
@@ -740,7 +1020,7 @@ def export_json(responses, user):
             'id': user.id,
             'department': user.department,
             'role_level': user.role_level,
-            'created_at': user.created_at.isoformat(),
+            'created_at': user.created_at,
             'total_responses': len(responses)
         },
         'wellness_data': []
@@ -748,12 +1028,12 @@ def export_json(responses, user):
 
     for response in responses:
         data['wellness_data'].append({
-            'date': response.created_at.isoformat(),
+            'date': response.created_at,
             'wellness_score': response.burnout_score,
             'urgency_level': response.urgency_level,
-            'concerns': json.loads(response.concerns) if response.concerns else [],
-            'recommendations': json.loads(response.recommendations) if response.recommendations else [],
-            'summary': json.loads(response.ai_analysis).get('summary', '') if response.ai_analysis else ''
+            'concerns': response.concerns or [],
+            'recommendations': response.recommendations or [],
+            'summary': response.summary or ''
         })
 
     return jsonify(data)
@@ -805,90 +1085,142 @@ def export_pdf(responses, user):
         logger.error(f"PDF export error: {str(e)}")
         return jsonify({'error': 'PDF generation failed'}), 500
 
-def calculate_progress_metrics(responses):
-    """Calculate detailed progress metrics from responses"""
-    if not responses:
+# Mock category breakdown (in real app, you'd categorize questions):
+# consistent "random" values per response count, drawn once from a seeded generator
+PROGRESS_CATEGORIES = ('energy', 'satisfaction', 'balance', 'stress')
+PROGRESS_LOW = np.array([5.0, 5.5, 4.5, 5.0])
+PROGRESS_HIGH = np.array([8.5, 8.0, 7.5, 8.0])
+PROGRESS_TABLE = np.random.default_rng(0).uniform(PROGRESS_LOW, PROGRESS_HIGH, size=(256, 4))
+
+def calculate_progress_metrics(response_count):
+    """Calculate detailed progress metrics from the number of recent responses"""
+    if not response_count:
         return {}
 
-    # Mock category breakdown (in real app, you'd categorize questions)
-    random.seed(len(responses))  # Consistent "random" data based on response count
+    row = PROGRESS_TABLE[response_count & 0xFF]
+    return dict(zip(PROGRESS_CATEGORIES, row.tolist()))
 
-    return {
-        'energy': random.uniform(5.0, 8.5),
-        'satisfaction': random.uniform(5.5, 8.0),
-        'balance': random.uniform(4.5, 7.5),
-        'stress': random.uniform(5.0, 8.0)
-    }
+# Upper bound on the check-in history scanned for a streak
+STREAK_MAX_DAYS = 400
 
 def calculate_check_in_streak(user_id):
     """Calculate current check-in streak"""
     try:
-        # Get all responses ordered by date descending
-        responses = DailyResponse.query.filter_by(user_id=user_id) \
-            .order_by(DailyResponse.created_at.desc()).all()
-
-        if not responses:
-            return 0
-
-        # Convert to dates only
-        response_dates = list(set(r.created_at.date() for r in responses))
-        response_dates.sort(reverse=True)
-
-        # Calculate streak
-        streak = 0
-        current_date = datetime.utcnow().date()
-
-        for response_date in response_dates:
-            if response_date == current_date or response_date == current_date - timedelta(days=streak):
-                streak += 1
-                current_date = response_date
-            else:
-                break
-
-        return streak
+        # Let the database reduce responses to distinct check-in dates, newest first.
+        # The date window keeps the index range scan bounded for long histories.
+        cutoff = datetime.utcnow() - timedelta(days=STREAK_MAX_DAYS)
+        check_in_date = db.func.date(DailyResponse.created_at, type_=db.Date)
+        with db.session.no_autoflush:
+            response_dates = db.session.execute(
+                db.select(check_in_date).distinct()
+                .where(DailyResponse.user_id == user_id, DailyResponse.created_at >= cutoff)
+                .order_by(check_in_date.desc())
+                .limit(STREAK_MAX_DAYS)
+            ).scalars()
+
+            return count_check_in_streak(response_dates)
 
     except Exception as e:
         logger.error(f"Streak calculation error: {str(e)}")
         return 0
 
-def analyze_wellness_trend(responses):
-    """Analyze wellness trend over time"""
-    if len(responses) < 2:
-        return "Not enough data for trend analysis"
-
-    # Get scores from first and second half of responses
-    mid_point = len(responses) // 2
-    first_half_avg = sum(r.burnout_score or 0 for r in responses[:mid_point]) / mid_point
-    second_half_avg = sum(r.burnout_score or 0 for r in responses[mid_point:]) / (len(responses) - mid_point)
+@njit('i8(i8[:], i8)', cache=True)
+def streak_from_ordinals(date_ordinals, today_ordinal):
+    """Count consecutive days ending today in distinct date ordinals, newest first"""
+    streak = 0
+    for date_ordinal in date_ordinals:
+        if date_ordinal != today_ordinal - streak:
+            break
+        streak += 1
+    return streak
+
+def count_check_in_streak(response_dates):
+    """Count the current streak from distinct check-in dates, newest first"""
+    date_ordinals = np.fromiter((d.toordinal() for d in response_dates), dtype=np.int64)
+    return int(streak_from_ordinals(date_ordinals, datetime.utcnow().date().toordinal()))
+
+def get_user_dashboard_stats(user_id, since):
+    """Get per-day (day, responses) rows for a user, newest first, in one query"""
+    cutoff = datetime.utcnow() - timedelta(days=STREAK_MAX_DAYS)
+    # responses counts only rows at or after `since`; older days come back with 0
+    # and only feed the streak
+    day = db.func.date(DailyResponse.created_at, type_=db.Date).label('day')
+
+    return db.session.execute(
+        db.select(
+            day,
+            db.func.count(db.case((DailyResponse.created_at >= since, 1))).label('responses')
+        )
+        .where(DailyResponse.user_id == user_id, DailyResponse.created_at >= cutoff)
+        .group_by(day)
+        .order_by(day.desc())
+        .limit(STREAK_MAX_DAYS)
+    ).all()
+
+def get_recent_scores(user_id, since):
+    """Get a user's burnout scores since a cutoff as a float64 array, oldest first"""
+    return np.fromiter(db.session.execute(
+        db.select(db.func.coalesce(DailyResponse.burnout_score, 0))
+        .where(DailyResponse.user_id == user_id, DailyResponse.created_at >= since)
+        .order_by(DailyResponse.created_at.asc())
+    ).scalars(), dtype=np.float64)
+
+WELLNESS_TREND_LABELS = (
+    "Significant improvement in wellness",
+    "Gradual improvement in wellness",
+    "Wellness requires attention",
+    "Stable wellness levels"
+)
+
+@njit('i4(f8[:])', cache=True)
+def wellness_trend_code(scores):
+    """Compare first/second half mean scores, returning an index into WELLNESS_TREND_LABELS"""
+    mid_point = scores.shape[0] // 2
+    first_half_avg = scores[:mid_point].mean()
+    second_half_avg = scores[mid_point:].mean()
 
     # Note: Lower burnout score = better wellness
     if second_half_avg < first_half_avg - 5:
-        return "Significant improvement in wellness"
+        return 0
     elif second_half_avg < first_half_avg:
-        return "Gradual improvement in wellness"
+        return 1
     elif second_half_avg > first_half_avg + 5:
-        return "Wellness requires attention"
+        return 2
     else:
-        return "Stable wellness levels"
+        return 3
+
+def analyze_wellness_trend(scores):
+    """Analyze wellness trend over time from a float64 array of scores, oldest first"""
+    if len(scores) < 2:
+        return "Not enough data for trend analysis"
+
+    return WELLNESS_TREND_LABELS[wellness_trend_code(scores)]
+
+def warm_up_kernels():
+    """Run each Numba kernel once so JIT/cache loading happens at boot, not on a request"""
+    wellness_trend_code(np.zeros(2, dtype=np.float64))
+    streak_from_ordinals(np.array([1, 0], dtype=np.int64), 1)
 
 # ==================== ERROR HANDLERS ====================
 
+NOT_FOUND_BODY = json_encoder.encode({
+    'error': 'Not Found',
+    'message': 'The requested resource was not found',
+    'available_endpoints': [
+        '/',
+        '/health',
+        '/register',
+        '/api/user-data',
+        '/api/user-progress',
+        '/api/company-analytics',
+        '/api/emergency-help',
+        '/api/export-data'
+    ]
+})
+
 @app.errorhandler(404)
 def not_found(error):
-    return jsonify({
-        'error': 'Not Found',
-        'message': 'The requested resource was not found',
-        'available_endpoints': [
-            '/',
-            '/health',
-            '/register',
-            '/api/user-data',
-            '/api/user-progress',
-            '/api/company-analytics',
-            '/api/emergency-help',
-            '/api/export-data'
-        ]
-    }), 404
+    return Response(NOT_FOUND_BODY, status=404, mimetype='application/json')
 
 @app.errorhandler(500)
 def internal_error(error):
@@ -896,7 +1228,7 @@ def internal_error(error):
     return jsonify({
         'error': 'Internal Server Error',
         'message': 'An unexpected error occurred',
-        'timestamp': datetime.now().isoformat()
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
     }), 500
 
 # ==================== INITIALIZATION ====================
@@ -928,6 +1260,8 @@ def create_tables():
         except Exception as e:
             print(f"❌ Database initialization failed: {e}")
 
+    warm_up_kernels()
+
 if __name__ == '__main__':
     print("🚀 Starting Bloom server...")
     print("🌸 AI-powered burnout prevention platform")
@@ -944,8 +1278,10 @@ if __name__ == '__main__':
     print("   • /api/user-data - Demo dashboard data")
     print("   • /api/company-analytics - Company insights")
     print("   • /api/emergency-help - Emergency features")
-    print("\n🛑 Press Ctrl+C to stop the server")
+    print("\n🏭 Production: gunicorn app:app (settings in gunicorn.conf.py)")
+    print("🛑 Press Ctrl+C to stop the server")
     print("=" * 50)
 
-    # Start Flask app
-    app.run(debug=True, port=5000, host='0.0.0.0')
\ No newline at end of file
+    # Start Flask development server; the debugger and reloader are opt-in via FLASK_DEBUG=1.
+    # Production runs under gunicorn instead (see gunicorn.conf.py)
+    app.run(debug=os.environ.get('FLASK_DEBUG') == '1', port=5000, host='0.0.0.0', threaded=True)
\ No newline at end of file
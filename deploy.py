@@ -16,9 +16,16 @@ class BloomDeployer:
         self.requirements_prod = [
             'flask>=2.3.0',
             'flask-sqlalchemy>=3.0.0',
+            'flask-compress>=1.25',
+            'msgspec>=0.18.0',
+            'numpy>=1.24.0',
+            'numba>=0.58.0',
+            'cachetools>=5.3.0',
             'openai>=1.0.0',
             'python-dotenv>=1.0.0',
             'gunicorn>=21.0.0',
+            'gevent>=23.9.0',
+            'psycogreen>=1.0.2',
             'psycopg2-binary>=2.9.0',
             'reportlab>=4.0.0',
             'openpyxl>=3.1.0'
@@ -86,7 +93,8 @@ USER bloom
 EXPOSE 8000
 
 # Run application
-CMD ["gunicorn", "--bind", "0.0.0.0:8000", "--workers", "4", "app:app"]
+# Worker settings (gevent) come from gunicorn.conf.py
+CMD ["gunicorn", "app:app"]
 """
         with open(self.project_root / 'Dockerfile', 'w') as f:
             f.write(dockerfile_content)
@@ -236,8 +244,8 @@ fi
 echo "🚀 Starting production server..."
 echo "Visit http://localhost:8000 to access your Bloom app"
 
-# Use gunicorn for production
-gunicorn --bind 0.0.0.0:8000 --workers 4 --timeout 120 app:app
+# Use gunicorn for production (gevent workers, see gunicorn.conf.py)
+gunicorn app:app
 """
         startup_script = self.project_root / 'start_production.sh'
         with open(startup_script, 'w') as f:
@@ -0,0 +1,34 @@
+"""
+Gunicorn configuration for Bloom
+Loaded automatically by `gunicorn app:app` from the project root
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+timeout = 120
+
+# The app is I/O-bound on database round-trips, so cooperative gevent workers
+# let each process keep serving requests while queries are outstanding.
+# Gunicorn monkey-patches the stdlib for gevent before the app is imported.
+# This gives the same I/O overlap an ASGI server would, without rewriting the
+# views as async: Flask's async views still run each request in a thread.
+worker_class = 'gevent'
+workers = int(os.environ.get('WEB_CONCURRENCY', '2'))
+worker_connections = 500
+
+
+def post_fork(server, worker):
+    """Let psycopg2 yield to the gevent hub while waiting on Postgres"""
+    try:
+        from psycogreen.gevent import patch_psycopg
+    except ImportError:
+        server.log.warning("psycogreen not installed; Postgres queries will block the worker")
+        return
+    patch_psycopg()
+
+
+def post_worker_init(worker):
+    """Load the Numba kernels before the worker accepts its first request"""
+    from app import warm_up_kernels
+    warm_up_kernels()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Bloom Database Migrations
+One-shot upgrades for databases created by earlier versions of the app
+"""
+
+import sys
+import msgspec
+
+from app import app, db
+
+MSGPACK_COLUMNS = ['questions', 'responses', 'ai_analysis', 'concerns', 'recommendations']
+
+
+def is_legacy_json(value):
+    """Legacy rows hold JSON text; MsgPack maps/arrays never start with these bytes"""
+    if isinstance(value, str):
+        return True
+    return bool(value) and bytes(value[:1]) in (b'{', b'[', b'"')
+
+
+def migrate_json_to_msgpack():
+    """Re-encode the JSON text columns of daily_responses as MsgPack blobs"""
+    print("📦 Converting daily_responses JSON columns to MsgPack...")
+    encoder = msgspec.msgpack.Encoder()
+    decoder = msgspec.json.Decoder()
+
+    if db.engine.dialect.name == 'postgresql':
+        for column in MSGPACK_COLUMNS:
+            data_type = db.session.execute(db.text(
+                "SELECT data_type FROM information_schema.columns "
+                "WHERE table_name = 'daily_responses' AND column_name = :column"
+            ), {'column': column}).scalar()
+            if data_type == 'text':
+                db.session.execute(db.text(
+                    f"ALTER TABLE daily_responses ALTER COLUMN {column} TYPE BYTEA "
+                    f"USING convert_to({column}, 'UTF8')"
+                ))
+
+    columns = ', '.join(MSGPACK_COLUMNS)
+    rows = db.session.execute(db.text(f"SELECT id, {columns} FROM daily_responses")).all()
+
+    converted = 0
+    for row in rows:
+        values = {}
+        for column in MSGPACK_COLUMNS:
+            value = getattr(row, column)
+            if value is not None and is_legacy_json(value):
+                values[column] = encoder.encode(decoder.decode(value))
+        if values:
+            assignments = ', '.join(f"{column} = :{column}" for column in values)
+            db.session.execute(
+                db.text(f"UPDATE daily_responses SET {assignments} WHERE id = :id"),
+                {'id': row.id, **values}
+            )
+            converted += 1
+
+    db.session.commit()
+    print(f"   ✅ Converted {converted} of {len(rows)} responses")
+
+
+def add_summary_column():
+    """Add daily_responses.summary and backfill it from ai_analysis"""
+    print("📝 Adding summary column to daily_responses...")
+    columns = {column['name'] for column in db.inspect(db.engine).get_columns('daily_responses')}
+    if 'summary' not in columns:
+        db.session.execute(db.text("ALTER TABLE daily_responses ADD COLUMN summary VARCHAR(500)"))
+
+    decoder = msgspec.msgpack.Decoder()
+    rows = db.session.execute(db.text(
+        "SELECT id, ai_analysis FROM daily_responses "
+        "WHERE summary IS NULL AND ai_analysis IS NOT NULL"
+    )).all()
+
+    for row in rows:
+        summary = decoder.decode(row.ai_analysis).get('summary')
+        if summary:
+            db.session.execute(
+                db.text("UPDATE daily_responses SET summary = :summary WHERE id = :id"),
+                {'id': row.id, 'summary': summary[:500]}
+            )
+
+    db.session.commit()
+    print(f"   ✅ Backfilled summaries for {len(rows)} responses")
+
+
+def add_user_created_index():
+    """Replace the single-column user_id/created_at indexes with a composite one"""
+    print("🗂️  Creating composite (user_id, created_at DESC) index...")
+    # Postgres builds the index without locking writes, which needs autocommit
+    concurrently = 'CONCURRENTLY ' if db.engine.dialect.name == 'postgresql' else ''
+    with db.engine.connect().execution_options(isolation_level='AUTOCOMMIT') as conn:
+        conn.execute(db.text(
+            f"CREATE INDEX {concurrently}IF NOT EXISTS ix_dr_user_created "
+            f"ON daily_responses (user_id, created_at DESC)"
+        ))
+        for old_index in ('ix_resp_user_created', 'ix_daily_responses_user_id', 'ix_daily_responses_created_at'):
+            conn.execute(db.text(f"DROP INDEX {concurrently}IF EXISTS {old_index}"))
+    print("   ✅ Index ix_dr_user_created ready")
+
+
+MIGRATIONS = [
+    migrate_json_to_msgpack,
+    add_summary_column,
+    add_user_created_index,
+]
+
+
+def main():
+    with app.app_context():
+        try:
+            for migration in MIGRATIONS:
+                migration()
+        except Exception as e:
+            db.session.rollback()
+            print(f"❌ Migration failed: {e}")
+            return 1
+
+    print("🌸 Database migrations complete!")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,10 +1,24 @@
 from flask_sqlalchemy import SQLAlchemy
 from datetime import datetime
 import uuid
-import json
+import msgspec
 
 db = SQLAlchemy()
 
+class MsgPackType(db.TypeDecorator):
+    """Stores Python lists/dicts as MsgPack-encoded binary"""
+    impl = db.LargeBinary
+    cache_ok = True
+
+    _encoder = msgspec.msgpack.Encoder()
+    _decoder = msgspec.msgpack.Decoder()
+
+    def process_bind_param(self, value, dialect):
+        return self._encoder.encode(value) if value is not None else None
+
+    def process_result_value(self, value, dialect):
+        return self._decoder.decode(value) if value is not None else None
+
 class User(db.Model):
     """Anonymous user model - no personal data stored"""
     __tablename__ = 'users'
@@ -17,7 +31,8 @@ class User(db.Model):
     last_active = db.Column(db.DateTime, default=datetime.utcnow)
 
     # Relationships
-    responses = db.relationship('DailyResponse', backref='user', lazy=True, cascade='all, delete-orphan')
+    # lazy='raise' turns accidental N+1 loads into errors; use selectinload(User.responses) when needed
+    responses = db.relationship('DailyResponse', back_populates='user', lazy='raise', cascade='all, delete-orphan')
 
     def __repr__(self):
         return f'<User {self.id[:8]}... {self.department}>'
@@ -27,57 +42,59 @@ class User(db.Model):
             'id': self.id,
             'department': self.department,
             'role_level': self.role_level,
-            'created_at': self.created_at.isoformat(),
+            'created_at': self.created_at,
             'days_active': (datetime.utcnow() - self.created_at).days
         }
 
 class DailyResponse(db.Model):
     """Daily questionnaire responses with AI analysis"""
     __tablename__ = 'daily_responses'
+    __table_args__ = (
+        # Matches the per-user, newest-first streak/trend and dashboard queries
+        db.Index('ix_dr_user_created', 'user_id', db.text('created_at DESC')),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
-    user_id = db.Column(db.String(36), db.ForeignKey('users.id'), nullable=False, index=True)
+    user_id = db.Column(db.String(36), db.ForeignKey('users.id'), nullable=False)
 
     # Raw questionnaire data
-    questions = db.Column(db.Text, nullable=False)  # JSON string of questions asked
-    responses = db.Column(db.Text, nullable=False)  # JSON string of user responses
+    questions = db.Column(MsgPackType, nullable=False)  # List of questions asked
+    responses = db.Column(MsgPackType, nullable=False)  # List of user responses
 
     # AI analysis results
     burnout_score = db.Column(db.Float, nullable=True, index=True)
-    ai_analysis = db.Column(db.Text, nullable=True)  # JSON string of full AI analysis
-    concerns = db.Column(db.Text, nullable=True)  # JSON array of identified concerns
-    recommendations = db.Column(db.Text, nullable=True)  # JSON array of recommendations
+    ai_analysis = db.Column(MsgPackType, nullable=True)  # Full AI analysis dict
+    concerns = db.Column(MsgPackType, nullable=True)  # List of identified concerns
+    recommendations = db.Column(MsgPackType, nullable=True)  # List of recommendations
     urgency_level = db.Column(db.String(20), nullable=True, index=True)  # low, medium, high
+    summary = db.Column(db.String(500), nullable=True)  # Copy of ai_analysis['summary'] for exports
 
     # Metadata
     response_time_seconds = db.Column(db.Integer, nullable=True)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    # Relationships
+    user = db.relationship('User', back_populates='responses')
 
     def __repr__(self):
         return f'<Response {self.id} - Score: {self.burnout_score}>'
 
     def get_responses_dict(self):
-        """Parse responses JSON safely"""
-        try:
-            return json.loads(self.responses) if self.responses else {}
-        except json.JSONDecodeError:
-            return {}
+        """Return responses, or an empty dict when missing"""
+        return self.responses or {}
 
     def get_analysis_dict(self):
-        """Parse AI analysis JSON safely"""
-        try:
-            return json.loads(self.ai_analysis) if self.ai_analysis else {}
-        except json.JSONDecodeError:
-            return {}
+        """Return AI analysis, or an empty dict when missing"""
+        return self.ai_analysis or {}
 
     def to_dict(self):
         return {
             'id': self.id,
             'burnout_score': self.burnout_score,
             'urgency_level': self.urgency_level,
-            'concerns': json.loads(self.concerns) if self.concerns else [],
-            'recommendations': json.loads(self.recommendations) if self.recommendations else [],
-            'created_at': self.created_at.isoformat(),
+            'concerns': self.concerns or [],
+            'recommendations': self.recommendations or [],
+            'created_at': self.created_at,
             'responses': self.get_responses_dict()
         }
 